@@ -45,7 +45,7 @@ def read_json_file(filename: str) -> list:
                     'date': operation.get('date', '').strip(),
                     'amount': amount,
                     'description': operation.get('description', '').strip(),
-                    'category': transact_type
+                    'type': transact_type
                 }
                 single_format.append(transaction)
 